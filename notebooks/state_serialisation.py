@@ -46,6 +46,30 @@ model.step()
 serialised_model = model.to_toml()
 print(serialised_model)
 
+# %% [markdown]
+# The state of a model can also be serialised to JSON.
+# This is less readable than TOML, but is much faster to encode and decode.
+# Values that have not yet been solved for (NaN) are stored as `null`.
+
+# %%
+json_model = model.to_json()
+assert Model.from_json(json_model).current_time() == model.current_time()
+
+# %% [markdown]
+# A binary format is also available using MessagePack.
+# `rscm.serialisation` provides helpers to append the state after each step
+# to a single file and to read those states back in order.
+
+# %%
+import io
+
+from rscm.serialisation import read_states, write_state
+
+stream = io.BytesIO()
+write_state(stream, model)
+stream.seek(0)
+assert next(read_states(stream)).current_time() == model.current_time()
+
 # %% [markdown]
 # ## Recreating the model state
 #
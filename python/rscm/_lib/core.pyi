@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import Protocol, Self, TypeVar
+from typing import Any, Protocol, Self, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
@@ -15,8 +15,18 @@ class TimeAxis:
     def from_values(values: Arr) -> TimeAxis: ...
     @staticmethod
     def from_bounds(values: Arr) -> TimeAxis: ...
-    def values(self): ...
-    def bounds(self): ...
+    def values(self) -> Arr: ...
+    def bounds(self) -> Arr: ...
+    def values_view(self) -> Arr:
+        """
+        Get a read-only view of the values
+
+        Unlike `values`, the underlying data is not copied.
+
+        Returns
+        -------
+        Read-only array of the values
+        """
     def __len__(self) -> int: ...
     def at(self, index: int) -> F: ...
     def at_bounds(self, index: int) -> tuple[F, F]: ...
@@ -34,6 +44,17 @@ class Timeseries:
     def __len__(self) -> int: ...
     def set(self, index: int, value: float): ...
     def values(self) -> Arr: ...
+    def values_view(self) -> Arr:
+        """
+        Get a read-only view of the values
+
+        Unlike `values`, the underlying data is not copied
+        so the view reflects any later changes made using `set`.
+
+        Returns
+        -------
+        Read-only array of the values
+        """
     @property
     def latest(self) -> int: ...
     @property
@@ -73,6 +94,39 @@ class TimeseriesCollection:
     def add_timeseries(
         self, name: str, timeseries: Timeseries, variable_type: VariableType
     ): ...
+    def add_many(  # noqa: PLR0913
+        self,
+        names: list[str],
+        values: Arr,
+        time_axis: TimeAxis,
+        units: list[str],
+        variable_types: list[VariableType],
+        interpolation_strategy: InterpolationStrategy,
+    ):
+        """
+        Add many timeseries which share a time axis to the collection
+
+        Parameters
+        ----------
+        names
+            Name of each timeseries
+        values
+            2D array of values with a row for each timeseries
+        time_axis
+            Time axis of the values
+        units
+            Units of each timeseries
+        variable_types
+            Variable type of each timeseries
+        interpolation_strategy
+            Interpolation strategy used for all of the timeseries
+
+        Raises
+        ------
+        ValueError
+            The dimensions of the arguments don't match
+            or a name is duplicated or already exists in the collection
+        """
     def get_timeseries_by_name(self, name: str) -> Timeseries | None:
         """
         Get a timeseries from the collection by name
@@ -132,6 +186,12 @@ class CustomComponent(Protocol):
     """
     Interface required for registering Python-based component
 
+    A component may optionally provide a `solve_batch` method to solve
+    many time steps in a single call
+    (see `BatchedCustomComponent`)
+    or a `solve_into` method to write the output state into an existing
+    dictionary (see `SolveIntoCustomComponent`).
+
     See Also
     --------
     UserDefinedComponent
@@ -142,6 +202,78 @@ class CustomComponent(Protocol):
         self, t_current: float, t_next: float, input_state: dict[str, float]
     ) -> dict[str, float]: ...
 
+class BatchedCustomComponent(CustomComponent, Protocol):
+    """
+    Python-based component which can be solved for many time steps at once
+
+    If all the inputs of the component are exogenous,
+    `Model.run` calls `solve_batch` once for all the remaining time steps
+    instead of calling `solve` on each time step.
+
+    An error raised by `solve_batch`, or a result with the wrong shape,
+    stops the model rather than falling back to `solve`.
+    """
+
+    def solve_batch(self, time_bounds: Arr, input_states: Arr) -> Arr:
+        """
+        Solve the component for a sequence of time steps
+
+        Parameters
+        ----------
+        time_bounds
+            Bounds of each time step
+
+            This has one more value than the number of time steps.
+        input_states
+            Input values with shape (time steps, inputs)
+
+            The columns are in the same order as the input definitions.
+
+        Returns
+        -------
+        Output values at the end of each time step
+
+        Must be a float64 array with shape (time steps, outputs)
+        with columns in the same order as the output definitions.
+        """
+
+class SolveIntoCustomComponent(CustomComponent, Protocol):
+    """
+    Python-based component which writes its output state into a dictionary
+
+    If present, `solve_into` is called instead of `solve`.
+    Output dictionaries are reused between calls to avoid allocating a new
+    dictionary on each time step.
+    Concurrent calls never share a dictionary so a component can be shared
+    between models which are run concurrently.
+    """
+
+    def solve_into(
+        self,
+        t_current: float,
+        t_next: float,
+        input_state: dict[str, float],
+        output_state: dict[str, float],
+    ) -> None:
+        """
+        Solve the component for a given timestep
+
+        Parameters
+        ----------
+        t_current
+            Start of the timestep
+        t_next
+            End of the timestep
+        input_state
+            State at the start of the timestep
+        output_state
+            Empty dictionary to be populated with the state at the end
+            of the timestep
+
+            This dictionary is cleared and reused after the call
+            so references to it should not be kept.
+        """
+
 class ComponentBuilder(Protocol):
     """A component of the model that can be solved"""
 
@@ -227,8 +359,20 @@ class Model:
 
     def current_time(self) -> F: ...
     def current_time_bounds(self) -> (F, F): ...
-    def step(self): ...
-    def run(self): ...
+    def step(self):
+        """
+        Solve the model for the current time step
+
+        The GIL is released while the model is solved so multiple models can be stepped
+        concurrently using threads.
+        """
+    def run(self):
+        """
+        Solve the model until the end of the time axis
+
+        The GIL is released while the model is solved so multiple models can be run
+        concurrently using threads.
+        """
     def as_dot(self) -> str: ...
     def finished(self) -> bool: ...
     def timeseries(self) -> TimeseriesCollection:
@@ -270,3 +414,90 @@ class Model:
         -------
         New model object with the state as defined in the TOML string.
         """
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the current state of the model to a dictionary.
+
+        The dictionary only contains native Python types so it can be passed to
+        any serialiser.
+
+        Returns
+        -------
+        Dictionary representation of the model, including the state required to
+        recreate the model at a later time.
+        """
+
+    @classmethod
+    def from_dict(cls: type[T], value: dict[str, Any]) -> T:
+        """
+        Create a model from a dictionary.
+
+        Parameters
+        ----------
+        value
+            Dictionary representing the model.
+
+            This is typically the output of `~Model.to_dict`.
+
+        Returns
+        -------
+        New model object with the state as defined in the dictionary.
+        """
+
+    def to_json(self) -> bytes:
+        """
+        Serialise the current state of the model to JSON.
+
+        Any values which have not yet been solved for (NaN) are encoded as `null`.
+
+        Returns
+        -------
+        UTF-8 encoded JSON representation of the model
+        """
+
+    @classmethod
+    def from_json(cls: type[T], serialised_model: bytes | str) -> T:
+        """
+        Create a model from a JSON representation.
+
+        Parameters
+        ----------
+        serialised_model
+            JSON representing the model
+
+        Returns
+        -------
+        New model object with the state as defined in the JSON.
+        """
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialise the current state of the model to MessagePack.
+
+        This binary representation is more compact and faster to generate than
+        the TOML or JSON representations.
+
+        See Also
+        --------
+        rscm.serialisation.write_state
+
+        Returns
+        -------
+        MessagePack representation of the model
+        """
+
+    @classmethod
+    def from_msgpack(cls: type[T], serialised_model: bytes) -> T:
+        """
+        Create a model from a MessagePack representation.
+
+        Parameters
+        ----------
+        serialised_model
+            MessagePack bytes representing the model
+
+        Returns
+        -------
+        New model object with the state as defined in the MessagePack bytes.
+        """
@@ -0,0 +1,280 @@
+"""
+Python components with a solve function compiled using numba
+
+The compiled function (kernel) operates on arrays instead of dictionaries
+so that it can be compiled in nopython mode.
+The mapping between variable names and array positions is determined once
+from the component's definitions,
+rather than on each call.
+
+numba is an optional dependency and can be installed via the `jit` extra.
+
+Compiled kernels are cached on disk so that the compilation cost is only paid once.
+Cached kernels are invalidated whenever the source of the kernel changes.
+The cache is stored in `CACHE_DIR` unless numba's `NUMBA_CACHE_DIR` is set,
+in which case numba's cache directory is used instead.
+Other numba functions are unaffected by `CACHE_DIR`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import os
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+
+from rscm._lib.core import PythonComponent, RequirementDefinition, RequirementType
+
+_INPUT_TYPES = (RequirementType.Input, RequirementType.InputAndOutput)
+_OUTPUT_TYPES = (RequirementType.Output, RequirementType.InputAndOutput)
+
+CACHE_DIR = ".rscm_cache"
+"""
+Directory used to cache compiled kernels if `NUMBA_CACHE_DIR` isn't set
+
+Relative paths are resolved against the working directory at the time
+a `JitComponent` is created.
+"""
+
+# numba's cache directory is global so components created concurrently
+# must not change it at the same time
+_CACHE_DIR_LOCK = threading.Lock()
+
+
+def _import_numba() -> Any:
+    try:
+        import numba
+    except ImportError as e:  # pragma: no cover
+        msg = (
+            "numba is required to compile components. "
+            "Install it with `pip install rscm[jit]`"
+        )
+        raise ImportError(msg) from e
+
+    return numba
+
+
+@contextlib.contextmanager
+def _kernel_cache_dir(numba: Any) -> Iterator[None]:
+    # numba only reads its cache directory when caching is enabled for a function,
+    # so it is only changed while a kernel is being decorated
+    with _CACHE_DIR_LOCK:
+        previous = numba.config.CACHE_DIR
+        if not previous:
+            numba.config.CACHE_DIR = os.path.abspath(CACHE_DIR)
+        try:
+            yield
+        finally:
+            numba.config.CACHE_DIR = previous
+
+
+def source_hash(kernel: Callable[..., Any]) -> str:
+    """
+    Calculate a hash of the source code of a kernel
+
+    Parameters
+    ----------
+    kernel
+        Function to hash
+
+    Returns
+    -------
+    Hex digest of the blake2b hash of the source
+    """
+    return hashlib.blake2b(inspect.getsource(kernel).encode()).hexdigest()
+
+
+def _invalidate_stale_cache(dispatcher: Any, kernel: Callable[..., Any]) -> None:
+    # The hash of the source is stored next to numba's cache files
+    # using the same name as the index file.
+    # If it doesn't match the current source the cached kernel is discarded.
+    cache = dispatcher._cache
+    hash_path = os.path.join(cache.cache_path, f"{cache._impl.filename_base}.blake2b")
+    current_hash = source_hash(kernel)
+    try:
+        with open(hash_path) as fh:
+            previous_hash = fh.read()
+    except FileNotFoundError:
+        previous_hash = None
+
+    if previous_hash != current_hash:
+        cache.flush()
+        os.makedirs(cache.cache_path, exist_ok=True)
+        with open(hash_path, "w") as fh:
+            fh.write(current_hash)
+
+
+def kernel_signature() -> Any:
+    """
+    Get the numba signature of a kernel
+
+    Kernels are called with the start and end of the timestep
+    and a contiguous array of the input values.
+    They must return an array of output values.
+
+    Returns
+    -------
+    Signature equivalent to `float64[:](float64, float64, float64[::1])`
+    """
+    numba = _import_numba()
+
+    return numba.float64[:](numba.float64, numba.float64, numba.float64[::1])
+
+
+class JitComponent:
+    """
+    A Python component with a numba-compiled solve function
+
+    This conforms with the `rscm._lib.core.CustomComponent` protocol.
+
+    The kernel is compiled (or loaded from the cache) the first time
+    the component is solved or when `warmup` is called
+    and releases the GIL while running.
+
+    The array of inputs passed to the kernel is allocated once per thread
+    and reused for each timestep.
+    Each thread has its own array as the GIL is released while the kernel
+    reads from it.
+    """
+
+    def __init__(
+        self,
+        definitions: list[RequirementDefinition],
+        kernel: Callable[[float, float, np.ndarray], np.ndarray],
+    ):
+        """
+        Create a component
+
+        The kernel isn't compiled until `warmup` is called
+        or the component is first solved.
+
+        Parameters
+        ----------
+        definitions
+            Requirements of the component
+
+            The order of the input definitions defines the order of the values
+            passed to the kernel and the order of the output definitions
+            defines the order of the values returned from the kernel.
+        kernel
+            Function to compile
+
+            This must be compatible with numba's nopython mode
+            and have the signature described by `kernel_signature`.
+        """
+        numba = _import_numba()
+
+        self._definitions = definitions
+        self.input_names = [
+            d.name for d in definitions if d.requirement_type in _INPUT_TYPES
+        ]
+        self.output_names = [
+            d.name for d in definitions if d.requirement_type in _OUTPUT_TYPES
+        ]
+        self._buffers = threading.local()
+        self._source = kernel
+        self._compiled = False
+        self._compile_lock = threading.Lock()
+        with _kernel_cache_dir(numba):
+            self.kernel = numba.njit(cache=True, nogil=True)(kernel)
+
+    def _input_buffer(self) -> np.ndarray:
+        try:
+            return self._buffers.inputs
+        except AttributeError:
+            inputs = np.empty(len(self.input_names), dtype=np.float64)
+            self._buffers.inputs = inputs
+            return inputs
+
+    def warmup(self) -> JitComponent:
+        """
+        Compile the kernel
+
+        This avoids the compilation cost being paid during the first timestep
+        of a model.
+
+        Returns
+        -------
+        The component
+        """
+        with self._compile_lock:
+            if not self._compiled:
+                _invalidate_stale_cache(self.kernel, self._source)
+                self.kernel.compile(kernel_signature())
+                self.kernel.disable_compile()
+                self._compiled = True
+        return self
+
+    def definitions(self) -> list[RequirementDefinition]:
+        """
+        Get the requirements of the component
+        """
+        return self._definitions
+
+    def solve(
+        self, time_current: float, time_next: float, input_state: dict[str, float]
+    ) -> dict[str, float]:
+        """
+        Solve the component for a given timestep
+
+        Parameters
+        ----------
+        time_current
+            Start of the timestep
+        time_next
+            End of the timestep
+        input_state
+            State at the start of the timestep
+
+        Raises
+        ------
+        ValueError
+            The kernel returned an unexpected number of values
+
+        Returns
+        -------
+        State at the end of the timestep
+        """
+        if not self._compiled:
+            self.warmup()
+
+        inputs = self._input_buffer()
+        for i, name in enumerate(self.input_names):
+            inputs[i] = input_state[name]
+        outputs = self.kernel(time_current, time_next, inputs)
+
+        if len(outputs) != len(self.output_names):
+            msg = "Unexpected number of outputs from kernel"
+            raise ValueError(msg)
+
+        return dict(zip(self.output_names, outputs.tolist()))
+
+
+def build_jit(
+    definitions: list[RequirementDefinition],
+    kernel: Callable[[float, float, np.ndarray], np.ndarray],
+) -> PythonComponent:
+    """
+    Compile a kernel and build a component which can be used in a model
+
+    Parameters
+    ----------
+    definitions
+        Requirements of the component
+    kernel
+        Function to compile
+
+    See Also
+    --------
+    JitComponent
+
+    Returns
+    -------
+    Component that can be coupled with other components via a `Model`
+    """
+    return PythonComponent.build(JitComponent(definitions, kernel))
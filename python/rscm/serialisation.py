@@ -0,0 +1,78 @@
+"""
+Storage of serialised model state
+
+Each state is stored as a MessagePack payload prefixed by its length.
+This allows the state of a model to be appended to a single file after every step
+and read back in order at a later time.
+"""
+
+import struct
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from rscm._lib.core import Model
+
+# 4-byte big-endian unsigned integer containing the length of the payload
+_HEADER = struct.Struct(">I")
+
+
+class TruncatedStateError(ValueError):
+    """
+    The stream ended part way through a state
+    """
+
+    def __init__(self, part: str):
+        super().__init__(f"Truncated state {part}")
+
+
+def write_state(stream: BinaryIO, model: Model) -> int:
+    """
+    Append the current state of a model to a stream
+
+    Parameters
+    ----------
+    stream
+        Binary stream to write to
+
+    model
+        Model to serialise
+
+    Returns
+    -------
+    Number of bytes written
+    """
+    payload = model.to_msgpack()
+
+    stream.write(_HEADER.pack(len(payload)))
+    stream.write(payload)
+
+    return _HEADER.size + len(payload)
+
+
+def read_states(stream: BinaryIO) -> Iterator[Model]:
+    """
+    Read the model states from a stream
+
+    Parameters
+    ----------
+    stream
+        Binary stream containing states written by `write_state`
+
+    Raises
+    ------
+    TruncatedStateError
+        The stream ended part way through a state
+
+    Returns
+    -------
+    Iterator of models in the order in which they were written
+    """
+    while header := stream.read(_HEADER.size):
+        if len(header) != _HEADER.size:
+            raise TruncatedStateError("header")
+        (size,) = _HEADER.unpack(header)
+
+        payload = stream.read(size)
+        if len(payload) != size:
+            raise TruncatedStateError("payload")
+        yield Model.from_msgpack(payload)
@@ -1,6 +1,7 @@
-use crate::errors::RSCMResult;
-use crate::timeseries::{FloatValue, Time};
+use crate::errors::{RSCMError, RSCMResult};
+use crate::timeseries::{FloatValue, Time, TimeAxis};
 use crate::timeseries_collection::{TimeseriesCollection, VariableType};
+use numpy::ndarray::{Array2, ArrayView1, ArrayView2};
 use pyo3::pyclass;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
@@ -195,14 +196,22 @@ pub trait Component: Debug + Send + Sync {
 
     /// Extract the input state for the current time step
     ///
+    /// The current time step is the step at `time_index` of `time_axis`.
+    ///
     /// By default, for endogenous variables which are calculated as part of the model
     /// the most recent value is used, whereas, for exogenous variables the values are linearly
     /// interpolated.
     /// This ensures that state calculated from previous components within the same timestep
     /// is used.
+    /// Exogenous variables which share `time_axis` are read directly without interpolating.
     ///
     /// The result should contain values for the current time step for all input variable
-    fn extract_state(&self, collection: &TimeseriesCollection, t_current: Time) -> InputState {
+    fn extract_state(
+        &self,
+        collection: &TimeseriesCollection,
+        time_axis: &TimeAxis,
+        time_index: usize,
+    ) -> InputState {
         let mut state = HashMap::new();
 
         self.input_names().into_iter().for_each(|name| {
@@ -211,7 +220,9 @@ pub trait Component: Debug + Send + Sync {
                 .unwrap_or_else(|| panic!("No timeseries with variable='{}'", name));
 
             let result = match ts.variable_type {
-                VariableType::Exogenous => ts.timeseries.at_time(t_current).unwrap(),
+                VariableType::Exogenous => {
+                    ts.timeseries.at_time_index(time_axis, time_index).unwrap()
+                }
                 VariableType::Endogenous => ts.timeseries.latest_value().unwrap(),
             };
             state.insert(name, result);
@@ -229,18 +240,53 @@ pub trait Component: Debug + Send + Sync {
         t_next: Time,
         input_state: &InputState,
     ) -> RSCMResult<OutputState>;
+
+    /// Whether the component can be solved for many time steps in a single call
+    ///
+    /// See [Component::solve_batch]
+    fn supports_batch(&self) -> bool {
+        false
+    }
+
+    /// Solve the component for a sequence of time steps in a single call
+    ///
+    /// This is an optional optimisation for components where each call is expensive
+    /// (e.g. components defined in Python).
+    /// A `Model` only uses this method if all the inputs of the component are exogenous
+    /// as the input state for each time step is then known before the model is run.
+    /// The input state is interpolated from the exogenous timeseries in the same way as
+    /// the default implementation of [Component::extract_state].
+    ///
+    /// `time_bounds` contains the bounds of each time step so has one more value than the
+    /// number of time steps.
+    /// Each row of `input_states` contains the input values for a time step in the order of
+    /// [Component::input_names].
+    ///
+    /// The result should contain a row for each time step with the output values in the
+    /// order of [Component::output_names].
+    fn solve_batch(
+        &self,
+        _time_bounds: ArrayView1<Time>,
+        _input_states: ArrayView2<FloatValue>,
+    ) -> RSCMResult<Array2<FloatValue>> {
+        Err(RSCMError::Error(
+            "Component does not support batched solving".to_string(),
+        ))
+    }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
     use crate::example_components::{TestComponent, TestComponentParameters};
+    use numpy::array;
 
     #[test]
     fn solve() {
         let component = TestComponent::from_parameters(TestComponentParameters { p: 2.0 });
 
-        let input_state = component.extract_state(&TimeseriesCollection::new(), 2020.0);
+        let time_axis = TimeAxis::from_values(array![2020.0, 2021.0]);
+        let input_state = component.extract_state(&TimeseriesCollection::new(), &time_axis, 0);
         let output_state = component.solve(2020.0, 2021.0, &input_state).unwrap();
 
         assert_eq!(*output_state.get("Concentrations|CO2"), 2.0 * 1.3);
@@ -4,7 +4,7 @@ use crate::component::{
     Component, InputState, OutputState, RequirementDefinition, RequirementType, State,
 };
 use crate::errors::RSCMResult;
-use crate::timeseries::{FloatValue, Time};
+use crate::timeseries::{FloatValue, Time, TimeAxis};
 use crate::timeseries_collection::TimeseriesCollection;
 use serde::{Deserialize, Serialize};
 
@@ -33,7 +33,12 @@ impl Component for TestComponent {
         ]
     }
 
-    fn extract_state(&self, _collection: &TimeseriesCollection, _t_current: Time) -> InputState {
+    fn extract_state(
+        &self,
+        _collection: &TimeseriesCollection,
+        _time_axis: &TimeAxis,
+        _time_index: usize,
+    ) -> InputState {
         InputState::from_vectors(vec![1.3], self.input_names())
     }
     fn solve(
@@ -16,7 +16,7 @@
 ///
 use crate::errors::RSCMResult;
 use num::Float;
-use numpy::ndarray::{ArrayBase, Data};
+use numpy::ndarray::{Array1, ArrayBase, Data};
 use numpy::Ix1;
 use strategies::{Interp1DStrategy, InterpolationStrategy};
 
@@ -56,6 +56,20 @@ where
     pub fn interpolate(&self, time_target: At::Elem) -> RSCMResult<Ay::Elem> {
         self.strategy.interpolate(&self.time, &self.y, time_target)
     }
+
+    /// Interpolate the values at many times
+    ///
+    /// This is faster than calling `interpolate` for each time.
+    pub fn interpolate_many<Bt>(
+        &self,
+        time_targets: &ArrayBase<Bt, Ix1>,
+    ) -> RSCMResult<Array1<Ay::Elem>>
+    where
+        Bt: Data<Elem = At::Elem>,
+    {
+        self.strategy
+            .interpolate_many(&self.time, &self.y, time_targets)
+    }
 }
 
 #[cfg(test)]
@@ -82,6 +96,26 @@ mod tests {
         assert_eq!(result, expected);
     }
 
+    #[test]
+    fn interpolate_many() {
+        let data = array![1.0, 1.5, 2.0];
+        let years = Array::range(2020.0, 2023.0, 1.0);
+        let query = array![2019.5, 2020.5, 2022.0, 2024.0];
+
+        let interpolator = Interp1d::new(
+            years,
+            data,
+            InterpolationStrategy::from(NextStrategy::new(true)),
+        );
+        let result = interpolator.interpolate_many(&query).unwrap();
+
+        let expected: Vec<_> = query
+            .iter()
+            .map(|t| interpolator.interpolate(*t).unwrap())
+            .collect();
+        assert_eq!(result.to_vec(), expected);
+    }
+
     #[test]
     fn interpolate_with_view() {
         let data = array![1.0, 1.5, 2.0];
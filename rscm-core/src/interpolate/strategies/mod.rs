@@ -7,7 +7,7 @@ use is_close::is_close;
 pub use linear_spline::LinearSplineStrategy;
 pub use next::NextStrategy;
 use num::{Float, ToPrimitive};
-use numpy::ndarray::{ArrayBase, Data};
+use numpy::ndarray::{Array1, ArrayBase, Data};
 use numpy::Ix1;
 pub use previous::PreviousStrategy;
 use serde::{Deserialize, Serialize};
@@ -99,6 +99,24 @@ where
         y: &ArrayBase<Ay, Ix1>,
         time_target: At::Elem,
     ) -> RSCMResult<Ay::Elem>;
+
+    /// Interpolate the values at many times
+    fn interpolate_many<Bt>(
+        &self,
+        time: &ArrayBase<At, Ix1>,
+        y: &ArrayBase<Ay, Ix1>,
+        time_targets: &ArrayBase<Bt, Ix1>,
+    ) -> RSCMResult<Array1<Ay::Elem>>
+    where
+        Bt: Data<Elem = At::Elem>,
+        At::Elem: Copy,
+    {
+        time_targets
+            .iter()
+            .map(|t| self.interpolate(time, y, *t))
+            .collect::<RSCMResult<Vec<_>>>()
+            .map(Array1::from_vec)
+    }
 }
 
 #[derive(Clone)]
@@ -127,6 +145,24 @@ where
             InterpolationStrategy::Previous(strat) => strat.interpolate(time, y, time_target),
         }
     }
+
+    fn interpolate_many<Bt>(
+        &self,
+        time: &ArrayBase<At, Ix1>,
+        y: &ArrayBase<Ay, Ix1>,
+        time_targets: &ArrayBase<Bt, Ix1>,
+    ) -> RSCMResult<Array1<Ay::Elem>>
+    where
+        Bt: Data<Elem = At::Elem>,
+        At::Elem: Copy,
+    {
+        // Match once outside of the loop so the loop is specialised for each strategy
+        match self {
+            InterpolationStrategy::Linear(strat) => strat.interpolate_many(time, y, time_targets),
+            InterpolationStrategy::Next(strat) => strat.interpolate_many(time, y, time_targets),
+            InterpolationStrategy::Previous(strat) => strat.interpolate_many(time, y, time_targets),
+        }
+    }
 }
 
 impl From<LinearSplineStrategy> for InterpolationStrategy {
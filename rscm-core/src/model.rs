@@ -15,8 +15,8 @@ use crate::component::{
 use crate::errors::RSCMResult;
 use crate::interpolate::strategies::{InterpolationStrategy, LinearSplineStrategy};
 use crate::timeseries::{FloatValue, Time, TimeAxis, Timeseries};
-use crate::timeseries_collection::{TimeseriesCollection, VariableType};
-use numpy::ndarray::Array;
+use crate::timeseries_collection::{TimeseriesCollection, TimeseriesItem, VariableType};
+use numpy::ndarray::{s, Array, Array2};
 use petgraph::dot::{Config, Dot};
 use petgraph::graph::NodeIndex;
 use petgraph::visit::{Bfs, IntoNeighbors, IntoNodeIdentifiers, Visitable};
@@ -256,7 +256,8 @@ impl ModelBuilder {
         assert!(!is_valid_graph(&graph));
 
         // Create the timeseries collection using the information from the components
-        let mut collection = TimeseriesCollection::new();
+        // The timeseries are all added at once so the collection is only sorted once
+        let mut items = Vec::with_capacity(definitions.len());
         for (name, definition) in definitions {
             assert_eq!(definition.name, name);
 
@@ -274,36 +275,43 @@ impl ModelBuilder {
                     // Note that timeseries that are initialised are defined as Endogenous
                     // all but the first time point come from the model.
                     // This could potentially be defined as a different VariableType if needed.
-                    collection.add_timeseries(name, ts, VariableType::Endogenous)
+                    items.push(TimeseriesItem {
+                        timeseries: ts,
+                        name,
+                        variable_type: VariableType::Endogenous,
+                    })
                 } else {
                     // Check if the timeseries is available in the provided exogenous variables
                     // then interpolate to the right timebase
                     let timeseries = self.exogenous_variables.get_timeseries_by_name(&name);
 
                     match timeseries {
-                        Some(timeseries) => collection.add_timeseries(
-                            name,
-                            timeseries
+                        Some(timeseries) => items.push(TimeseriesItem {
+                            timeseries: timeseries
                                 .to_owned()
                                 .interpolate_into(self.time_axis.clone()),
-                            VariableType::Exogenous,
-                        ),
+                            name,
+                            variable_type: VariableType::Exogenous,
+                        }),
                         None => println!("No exogenous data for {}", definition.name),
                     }
                 }
             } else {
                 // Create a placeholder for data that will be generated by the model
-                collection.add_timeseries(
-                    definition.name,
-                    Timeseries::new_empty(
+                // The values for every timestep are allocated up front and filled in place
+                items.push(TimeseriesItem {
+                    timeseries: Timeseries::new_empty(
                         self.time_axis.clone(),
                         definition.unit,
                         InterpolationStrategy::from(LinearSplineStrategy::new(true)),
                     ),
-                    VariableType::Endogenous,
-                )
+                    name: definition.name,
+                    variable_type: VariableType::Endogenous,
+                })
             }
         }
+        let mut collection = TimeseriesCollection::new();
+        collection.add_many(items);
 
         // Add the components to the graph
         Model::new(graph, initial_node, collection, self.time_axis.clone())
@@ -316,6 +324,31 @@ impl Default for ModelBuilder {
     }
 }
 
+/// Output state for a component that was solved for many time steps in a single call
+///
+/// See [Component::solve_batch]
+#[derive(Debug)]
+struct BatchedOutput {
+    /// Time index of the first row of `values`
+    start_index: usize,
+    names: Vec<String>,
+    values: Array2<FloatValue>,
+}
+
+impl BatchedOutput {
+    /// Get the output state for a given time index
+    fn state_at(&self, time_index: usize) -> Option<OutputState> {
+        let row = time_index.checked_sub(self.start_index)?;
+        if row >= self.values.nrows() {
+            return None;
+        }
+        Some(OutputState::from_vectors(
+            self.values.row(row).to_vec(),
+            self.names.clone(),
+        ))
+    }
+}
+
 /// A coupled set of components that are solved on a common time axis.
 ///
 /// These components are solved over time steps defined by the ['time_axis'].
@@ -346,6 +379,15 @@ pub struct Model {
     collection: TimeseriesCollection,
     time_axis: Arc<TimeAxis>,
     time_index: usize,
+    /// Output state of components which have been solved ahead of time during a run
+    #[serde(skip)]
+    batched_outputs: HashMap<NodeIndex, BatchedOutput>,
+    /// The order in which the components are solved on each time step
+    ///
+    /// The component graph can't be modified after the model is built so the order is only
+    /// determined once.
+    #[serde(skip)]
+    solve_order: Vec<NodeIndex>,
 }
 
 impl Model {
@@ -361,6 +403,8 @@ impl Model {
             collection,
             time_axis,
             time_index: 0,
+            batched_outputs: HashMap::new(),
+            solve_order: vec![],
         }
     }
 
@@ -378,12 +422,22 @@ impl Model {
     /// to be later used by other components.
     /// The output state defines the values at the next time index as it represents the state
     /// at the start of the next timestep.
-    fn step_model_component(&mut self, component: C) {
-        let input_state = component.extract_state(&self.collection, self.current_time());
-
-        let (start, end) = self.current_time_bounds();
-
-        let result = component.solve(start, end, &input_state);
+    fn step_model_component(&mut self, node: NodeIndex, component: C) {
+        let batched = self
+            .batched_outputs
+            .get(&node)
+            .and_then(|batched| batched.state_at(self.time_index));
+
+        let result = match batched {
+            Some(output_state) => Ok(output_state),
+            None => {
+                let input_state =
+                    component.extract_state(&self.collection, &self.time_axis, self.time_index);
+                let (start, end) = self.current_time_bounds();
+
+                component.solve(start, end, &input_state)
+            }
+        };
 
         match result {
             Ok(output_state) => output_state.iter().for_each(|(key, value)| {
@@ -399,16 +453,104 @@ impl Model {
         }
     }
 
-    /// Step the model forward a step by solving each component for the current time step.
+    /// Determine the order in which the components are solved
     ///
     /// A breadth-first search across the component graph starting at the initial node
     /// will solve the components in a way that ensures any models with dependencies are solved
     /// after the dependent component is first solved.
-    fn step_model(&mut self) {
+    fn find_solve_order(&self) -> Vec<NodeIndex> {
+        let mut order = Vec::with_capacity(self.components.node_count());
         let mut bfs = Bfs::new(&self.components, self.initial_node);
         while let Some(nx) = bfs.next(&self.components) {
+            order.push(nx);
+        }
+        order
+    }
+
+    /// Step the model forward a step by solving each component for the current time step.
+    ///
+    /// See [Model::find_solve_order] for the order in which components are solved.
+    fn step_model(&mut self) {
+        // The order isn't serialised so is determined on the first step
+        if self.solve_order.is_empty() {
+            self.solve_order = self.find_solve_order();
+        }
+
+        for i in 0..self.solve_order.len() {
+            let nx = self.solve_order[i];
             let c = self.components.index(nx);
-            self.step_model_component(c.clone())
+            self.step_model_component(nx, c.clone())
+        }
+    }
+
+    /// Solve components which support batching for all the remaining time steps
+    ///
+    /// Only components where all the inputs are exogenous are solved ahead of time as the
+    /// input state for each time step doesn't depend on any other components.
+    /// The results are stored and written to the model's state as each step is performed.
+    /// Components with endogenous inputs are solved on each time step instead.
+    ///
+    /// Panics if solving a batch fails or the result doesn't contain a value for each output
+    /// and step, consistent with how errors when solving a single step are handled.
+    fn solve_batched_components(&mut self) {
+        let start_index = self.time_index;
+        let n_steps = self.time_axis.len() - 1 - start_index;
+        if n_steps == 0 {
+            return;
+        }
+        let time_axis = self.time_axis.clone();
+        let time_bounds = time_axis
+            .bounds()
+            .slice_move(s![start_index..start_index + n_steps + 1]);
+
+        let nodes: Vec<NodeIndex> = self.components.node_indices().collect();
+        for node in nodes {
+            let component = self.components.index(node).clone();
+            if !component.supports_batch() {
+                continue;
+            }
+
+            let input_names = component.input_names();
+            let all_exogenous = input_names.iter().all(|name| {
+                matches!(
+                    self.collection.get_by_name(name),
+                    Some(item) if item.variable_type == VariableType::Exogenous
+                )
+            });
+            if !all_exogenous {
+                continue;
+            }
+
+            let mut input_states = Array2::zeros((n_steps, input_names.len()));
+            for (step, mut row) in input_states.outer_iter_mut().enumerate() {
+                for (value, name) in row.iter_mut().zip(input_names.iter()) {
+                    *value = self
+                        .collection
+                        .get_timeseries_by_name(name)
+                        .unwrap()
+                        .at_time_index(&time_axis, start_index + step)
+                        .unwrap();
+                }
+            }
+
+            let output_names = component.output_names();
+            let values = component
+                .solve_batch(time_bounds.view(), input_states.view())
+                .unwrap_or_else(|err| panic!("Batched solving failed: {}", err));
+            assert_eq!(
+                values.dim(),
+                (n_steps, output_names.len()),
+                "Batched solving returned an unexpected shape"
+            );
+
+            self.batched_outputs.insert(
+                node,
+                BatchedOutput {
+                    start_index,
+                    names: output_names,
+                    values,
+                },
+            );
         }
     }
 
@@ -423,10 +565,16 @@ impl Model {
     }
 
     /// Steps the model until the end of the time axis
+    ///
+    /// Any components which support batching are solved for all the remaining steps
+    /// before stepping.
     pub fn run(&mut self) {
+        self.solve_batched_components();
+
         while self.time_index < self.time_axis.len() - 1 {
             self.step();
         }
+        self.batched_outputs.clear();
     }
 
     /// Create a diagram the represents the component graph
@@ -454,12 +602,101 @@ impl Model {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::errors::RSCMError;
     use crate::example_components::{TestComponent, TestComponentParameters};
     use crate::interpolate::strategies::PreviousStrategy;
     use is_close::is_close;
     use numpy::array;
-    use numpy::ndarray::Array;
+    use numpy::ndarray::{Array, ArrayView1, ArrayView2};
     use std::iter::zip;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    /// Component that doubles the emissions and supports batched solving
+    #[derive(Debug, Default, Serialize, Deserialize)]
+    struct BatchedComponent {
+        #[serde(skip)]
+        solve_calls: AtomicUsize,
+        #[serde(skip)]
+        batch_calls: AtomicUsize,
+    }
+
+    #[typetag::serde]
+    impl Component for BatchedComponent {
+        fn definitions(&self) -> Vec<RequirementDefinition> {
+            vec![
+                RequirementDefinition::new("Emissions|CO2", "GtC / yr", RequirementType::Input),
+                RequirementDefinition::new("Concentrations|CO2", "ppm", RequirementType::Output),
+            ]
+        }
+
+        fn solve(
+            &self,
+            _t_current: Time,
+            _t_next: Time,
+            input_state: &InputState,
+        ) -> RSCMResult<OutputState> {
+            self.solve_calls.fetch_add(1, Ordering::SeqCst);
+            Ok(OutputState::from_vectors(
+                vec![input_state.get("Emissions|CO2") * 2.0],
+                self.output_names(),
+            ))
+        }
+
+        fn supports_batch(&self) -> bool {
+            true
+        }
+
+        fn solve_batch(
+            &self,
+            time_bounds: ArrayView1<Time>,
+            input_states: ArrayView2<FloatValue>,
+        ) -> RSCMResult<Array2<FloatValue>> {
+            self.batch_calls.fetch_add(1, Ordering::SeqCst);
+            assert_eq!(time_bounds.len(), input_states.nrows() + 1);
+            Ok(input_states.mapv(|x| x * 2.0))
+        }
+    }
+
+    /// Component which claims to support batched solving but returns invalid results
+    #[derive(Debug, Default, Serialize, Deserialize)]
+    struct InvalidBatchedComponent {
+        wrong_shape: bool,
+    }
+
+    #[typetag::serde]
+    impl Component for InvalidBatchedComponent {
+        fn definitions(&self) -> Vec<RequirementDefinition> {
+            vec![
+                RequirementDefinition::new("Emissions|CO2", "GtC / yr", RequirementType::Input),
+                RequirementDefinition::new("Concentrations|CO2", "ppm", RequirementType::Output),
+            ]
+        }
+
+        fn solve(
+            &self,
+            _t_current: Time,
+            _t_next: Time,
+            _input_state: &InputState,
+        ) -> RSCMResult<OutputState> {
+            Ok(OutputState::from_vectors(vec![0.0], self.output_names()))
+        }
+
+        fn supports_batch(&self) -> bool {
+            true
+        }
+
+        fn solve_batch(
+            &self,
+            _time_bounds: ArrayView1<Time>,
+            input_states: ArrayView2<FloatValue>,
+        ) -> RSCMResult<Array2<FloatValue>> {
+            if self.wrong_shape {
+                Ok(Array2::zeros((input_states.nrows(), 2)))
+            } else {
+                Err(RSCMError::Error("Invalid batch".to_string()))
+            }
+        }
+    }
 
     fn get_emissions() -> Timeseries<FloatValue> {
         Timeseries::new(
@@ -507,6 +744,53 @@ mod tests {
         assert!(iter.all(|x| !x.is_nan()));
     }
 
+    #[test]
+    fn run_batched() {
+        let component = Arc::new(BatchedComponent::default());
+        let mut model = ModelBuilder::new()
+            .with_time_axis(TimeAxis::from_values(Array::range(2020.0, 2025.0, 1.0)))
+            .with_component(component.clone())
+            .with_exogenous_variable("Emissions|CO2", get_emissions())
+            .build();
+
+        model.step();
+        model.run();
+
+        assert_eq!(component.solve_calls.load(Ordering::SeqCst), 1);
+        assert_eq!(component.batch_calls.load(Ordering::SeqCst), 1);
+
+        let concentrations = model
+            .collection
+            .get_timeseries_by_name("Concentrations|CO2")
+            .unwrap();
+        assert!(concentrations.at(0).unwrap().is_nan());
+        assert!(concentrations.values().iter().skip(1).all(|x| *x == 20.0));
+    }
+
+    #[test]
+    #[should_panic(expected = "Batched solving failed: Invalid batch")]
+    fn run_batched_error() {
+        let mut model = ModelBuilder::new()
+            .with_time_axis(TimeAxis::from_values(Array::range(2020.0, 2025.0, 1.0)))
+            .with_component(Arc::new(InvalidBatchedComponent { wrong_shape: false }))
+            .with_exogenous_variable("Emissions|CO2", get_emissions())
+            .build();
+
+        model.run();
+    }
+
+    #[test]
+    #[should_panic(expected = "Batched solving returned an unexpected shape")]
+    fn run_batched_wrong_shape() {
+        let mut model = ModelBuilder::new()
+            .with_time_axis(TimeAxis::from_values(Array::range(2020.0, 2025.0, 1.0)))
+            .with_component(Arc::new(InvalidBatchedComponent { wrong_shape: true }))
+            .with_exogenous_variable("Emissions|CO2", get_emissions())
+            .build();
+
+        model.run();
+    }
+
     #[test]
     fn dot() {
         let time_axis = TimeAxis::from_values(Array::range(2020.0, 2025.0, 1.0));
@@ -1,11 +1,17 @@
 /// Macros for exposing a component to Python and using python-defined modules in rust
 use crate::component::{Component, InputState, OutputState};
-use crate::errors::RSCMResult;
+use crate::errors::{RSCMError, RSCMResult};
 use crate::timeseries::{FloatValue, Time};
+use numpy::ndarray::{Array2, ArrayView1, ArrayView2};
+use numpy::{PyArray2, PyArrayMethods, ToPyArray};
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyString};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::fmt::{Debug, Formatter};
+use std::sync::{Arc, Mutex};
 // Reexport the Requirement Definition
 pub use crate::component::{RequirementDefinition, RequirementType};
 
@@ -88,9 +94,95 @@ pub struct PyRustComponent(pub Arc<dyn Component + Send + Sync>);
 impl_component!(PyRustComponent);
 
 /// Wrapper to convert a PyObject (Python Class) into a Component
-#[derive(Debug)]
 pub struct PythonComponent {
     pub component: PyObject,
+    /// Whether the Python object provides a `solve_batch` method
+    has_batch: bool,
+    /// Whether the Python object provides a `solve_into` method
+    has_solve_into: bool,
+    /// Pool of dictionaries that are reused for the output state when calling `solve_into`
+    ///
+    /// The same component may be used by models that are solved concurrently in different
+    /// threads so a dictionary is taken from the pool for the duration of each call.
+    /// The pool only grows to the number of concurrent calls.
+    output_dicts: Mutex<Vec<Py<PyDict>>>,
+    /// Interned names of the input variables
+    ///
+    /// These are reused as the keys of the input state passed to `solve`
+    /// rather than creating new Python strings on every call.
+    input_keys: GILOnceCell<HashMap<String, Py<PyString>>>,
+}
+
+impl Debug for PythonComponent {
+    fn fmt(&self, f: &mut Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("PythonComponent")
+            .field("component", &self.component)
+            .finish()
+    }
+}
+
+impl PythonComponent {
+    pub fn new(component: PyObject) -> Self {
+        let (has_batch, has_solve_into) = Python::with_gil(|py| {
+            let bound = component.bind(py);
+            (
+                bound.hasattr(intern!(py, "solve_batch")).unwrap_or(false),
+                bound.hasattr(intern!(py, "solve_into")).unwrap_or(false),
+            )
+        });
+
+        Self {
+            component,
+            has_batch,
+            has_solve_into,
+            output_dicts: Mutex::new(Vec::new()),
+            input_keys: GILOnceCell::new(),
+        }
+    }
+
+    /// Take an empty output dictionary from the pool
+    ///
+    /// A new dictionary is created if none are available.
+    /// The lock is released before calling into Python.
+    fn take_output_dict<'py>(&self, py: Python<'py>) -> Bound<'py, PyDict> {
+        let output_dict = self.output_dicts.lock().unwrap().pop();
+        match output_dict {
+            Some(output_dict) => {
+                let output_dict = output_dict.into_bound(py);
+                output_dict.clear();
+                output_dict
+            }
+            None => PyDict::new_bound(py),
+        }
+    }
+
+    /// Return an output dictionary to the pool so it can be reused
+    fn return_output_dict(&self, output_dict: Bound<'_, PyDict>) {
+        self.output_dicts.lock().unwrap().push(output_dict.unbind());
+    }
+
+    /// Convert the input state into a Python dictionary
+    fn input_dict<'py>(&self, py: Python<'py>, input_state: &InputState) -> Bound<'py, PyDict> {
+        let input_keys = self.input_keys.get_or_init(py, || {
+            self.input_names()
+                .into_iter()
+                .map(|name| {
+                    let key = PyString::intern_bound(py, &name).unbind();
+                    (name, key)
+                })
+                .collect()
+        });
+
+        let dict = PyDict::new_bound(py);
+        input_state.iter().for_each(|(name, value)| {
+            match input_keys.get(name) {
+                Some(key) => dict.set_item(key, *value),
+                None => dict.set_item(name, *value),
+            }
+            .unwrap()
+        });
+        dict
+    }
 }
 
 #[typetag::serde]
@@ -100,7 +192,7 @@ impl Component for PythonComponent {
             let py_result = self
                 .component
                 .bind(py)
-                .call_method("definitions", (), None)
+                .call_method0(intern!(py, "definitions"))
                 .unwrap();
             let py_result: Vec<RequirementDefinition> = py_result.extract().unwrap();
             py_result
@@ -113,19 +205,61 @@ impl Component for PythonComponent {
         t_next: Time,
         input_state: &InputState,
     ) -> RSCMResult<OutputState> {
+        Python::with_gil(|py| {
+            let component = self.component.bind(py);
+            let input_state = self.input_dict(py, input_state);
+
+            let state = if self.has_solve_into {
+                // Write the output state into an existing dictionary instead of allocating a
+                // new dictionary on every call
+                let output_state = self.take_output_dict(py);
+
+                component
+                    .call_method1(
+                        intern!(py, "solve_into"),
+                        (t_current, t_next, input_state, &output_state),
+                    )
+                    .unwrap();
+                let state = OutputState::from_hashmap(output_state.extract().unwrap());
+                self.return_output_dict(output_state);
+                state
+            } else {
+                let py_result = component
+                    .call_method1(intern!(py, "solve"), (t_current, t_next, input_state))
+                    .unwrap();
+                OutputState::from_hashmap(py_result.extract().unwrap())
+            };
+
+            Ok(state)
+        })
+    }
+
+    fn supports_batch(&self) -> bool {
+        self.has_batch
+    }
+
+    fn solve_batch(
+        &self,
+        time_bounds: ArrayView1<Time>,
+        input_states: ArrayView2<FloatValue>,
+    ) -> RSCMResult<Array2<FloatValue>> {
         Python::with_gil(|py| {
             let py_result = self
                 .component
                 .bind(py)
-                .call_method(
-                    "solve",
-                    (t_current, t_next, input_state.clone().to_hashmap()),
-                    None,
+                .call_method1(
+                    intern!(py, "solve_batch"),
+                    (
+                        time_bounds.to_pyarray_bound(py),
+                        input_states.to_pyarray_bound(py),
+                    ),
                 )
-                .unwrap();
+                .map_err(|e| RSCMError::Error(e.to_string()))?;
 
-            let state = OutputState::from_hashmap(py_result.extract().unwrap());
-            Ok(state)
+            let values = py_result
+                .downcast_into::<PyArray2<FloatValue>>()
+                .map_err(|e| RSCMError::Error(e.to_string()))?;
+            Ok(values.to_owned_array())
         })
     }
 }
@@ -139,7 +273,7 @@ impl Serialize for PythonComponent {
             let py_result = self
                 .component
                 .bind(py)
-                .call_method("to_json", (), None)
+                .call_method0(intern!(py, "to_json"))
                 .unwrap();
             let py_result: String = py_result.extract().unwrap();
             serializer.serialize_str(&py_result)
@@ -158,7 +292,7 @@ impl<'de> Deserialize<'de> for PythonComponent {
                 .eval_bound(&format!("Component.from_json('{}')", s), None, None)
                 .unwrap()
                 .to_object(py);
-            Ok(PythonComponent { component })
+            Ok(PythonComponent::new(component))
         })
     }
 }
@@ -172,7 +306,7 @@ pub struct PyPythonComponent(pub Arc<PythonComponent>);
 impl PyPythonComponent {
     #[staticmethod]
     pub fn build(component: Py<PyAny>) -> Self {
-        Self(Arc::new(PythonComponent { component }))
+        Self(Arc::new(PythonComponent::new(component)))
     }
 }
 
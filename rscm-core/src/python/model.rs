@@ -7,6 +7,7 @@ use crate::python::PyRustComponent;
 use crate::timeseries::{FloatValue, Time};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use std::collections::HashMap;
 
 #[pyclass]
@@ -100,11 +101,17 @@ impl PyModel {
         self.0.current_time_bounds()
     }
 
+    // The GIL is released while the model is solved so that other Python threads can run.
+    // Components defined in Python reacquire the GIL when they are called.
     fn step(mut self_: PyRefMut<Self>) {
-        self_.0.step()
+        let py = self_.py();
+        let model = &mut self_.0;
+        py.allow_threads(|| model.step())
     }
     fn run(mut self_: PyRefMut<Self>) {
-        self_.0.run()
+        let py = self_.py();
+        let model = &mut self_.0;
+        py.allow_threads(|| model.run())
     }
 
     fn as_dot(&self) -> String {
@@ -141,4 +148,76 @@ impl PyModel {
             Err(e) => Err(PyValueError::new_err(format!("{}", e))),
         }
     }
+
+    /// Generate a dictionary representation of the model
+    ///
+    /// The resulting dictionary only contains native Python types
+    /// so it can be passed directly to a serialiser.
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let serialised = pythonize::pythonize(py, &self.0);
+        match serialised {
+            Ok(serialised) => Ok(serialised),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
+
+    /// Initialise a model from a dictionary representation
+    #[staticmethod]
+    fn from_dict(value: Bound<PyAny>) -> PyResult<Self> {
+        let deserialised = pythonize::depythonize_bound::<Model>(value);
+        match deserialised {
+            Ok(deserialised) => Ok(PyModel(deserialised)),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
+
+    /// Generate a JSON representation of the model
+    ///
+    /// The model is serialised directly to bytes without creating any intermediate
+    /// Python objects.
+    fn to_json<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let serialised = serde_json::to_vec(&self.0);
+        match serialised {
+            Ok(serialised) => Ok(PyBytes::new_bound(py, &serialised)),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
+
+    /// Initialise a model from a JSON representation
+    ///
+    /// Either bytes or a string can be used.
+    #[staticmethod]
+    fn from_json(serialised_model: Bound<PyAny>) -> PyResult<Self> {
+        // simd-json modifies the buffer while parsing so an owned copy of the input is needed
+        let mut buffer = match serialised_model.downcast::<PyBytes>() {
+            Ok(serialised_model) => serialised_model.as_bytes().to_vec(),
+            Err(_) => serialised_model.extract::<String>()?.into_bytes(),
+        };
+        let deserialised = simd_json::serde::from_slice::<Model>(&mut buffer);
+        match deserialised {
+            Ok(deserialised) => Ok(PyModel(deserialised)),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
+
+    /// Generate a MessagePack representation of the model
+    ///
+    /// This is a compact binary alternative to the TOML and JSON representations.
+    fn to_msgpack<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let serialised = rmp_serde::to_vec_named(&self.0);
+        match serialised {
+            Ok(serialised) => Ok(PyBytes::new_bound(py, &serialised)),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
+
+    /// Initialise a model from a MessagePack representation
+    #[staticmethod]
+    fn from_msgpack(serialised_model: &[u8]) -> PyResult<Self> {
+        let deserialised = rmp_serde::from_slice::<Model>(serialised_model);
+        match deserialised {
+            Ok(deserialised) => Ok(PyModel(deserialised)),
+            Err(e) => Err(PyValueError::new_err(format!("{}", e))),
+        }
+    }
 }
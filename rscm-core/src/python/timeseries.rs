@@ -35,6 +35,16 @@ impl PyTimeAxis {
         self.0.bounds().to_pyarray_bound(py)
     }
 
+    /// Get a read-only view of the values without copying
+    fn values_view<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<Time>>> {
+        let this = slf.borrow();
+        // The time axis is immutable and is kept alive by the container
+        let array =
+            unsafe { PyArray1::borrow_from_array_bound(&this.0.values(), slf.clone().into_any()) };
+        array.call_method1("setflags", (false,))?;
+        Ok(array)
+    }
+
     fn __len__(&self) -> usize {
         self.0.len()
     }
@@ -128,6 +138,18 @@ impl PyTimeseries {
         self.0.values().to_pyarray_bound(py)
     }
 
+    /// Get a read-only view of the values without copying
+    ///
+    /// The view reflects any later modifications made using `set`.
+    fn values_view<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<FloatValue>>> {
+        let this = slf.borrow();
+        // The values are never reallocated and are kept alive by the container
+        let array =
+            unsafe { PyArray1::borrow_from_array_bound(&this.0.values(), slf.clone().into_any()) };
+        array.call_method1("setflags", (false,))?;
+        Ok(array)
+    }
+
     fn __len__(&self) -> usize {
         self.0.len()
     }
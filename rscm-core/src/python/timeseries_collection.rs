@@ -1,7 +1,12 @@
-use crate::python::timeseries::PyTimeseries;
-use crate::timeseries_collection::TimeseriesCollection;
+use crate::interpolate::strategies::InterpolationStrategy;
+use crate::python::timeseries::{PyInterpolationStrategy, PyTimeAxis, PyTimeseries};
+use crate::timeseries::{FloatValue, Timeseries};
 pub use crate::timeseries_collection::VariableType;
+use crate::timeseries_collection::{TimeseriesCollection, TimeseriesItem};
+use numpy::{PyReadonlyArray2, PyUntypedArrayMethods};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use std::collections::HashSet;
 
 #[pyclass]
 #[pyo3(name = "TimeseriesCollection")]
@@ -29,6 +34,63 @@ impl PyTimeseriesCollection {
         self.0.add_timeseries(name, timeseries, variable_type);
     }
 
+    /// Add many timeseries sharing a time axis in a single call
+    ///
+    /// Each row of `values` is used as the values of the corresponding timeseries.
+    pub fn add_many(
+        &mut self,
+        names: Vec<String>,
+        values: PyReadonlyArray2<FloatValue>,
+        time_axis: Bound<PyTimeAxis>,
+        units: Vec<String>,
+        variable_types: Vec<VariableType>,
+        interpolation_strategy: PyInterpolationStrategy,
+    ) -> PyResult<()> {
+        let time_axis = time_axis.borrow().0.clone();
+        let shape = values.shape();
+
+        if shape[0] != names.len()
+            || units.len() != names.len()
+            || variable_types.len() != names.len()
+        {
+            return Err(PyValueError::new_err("Lengths do not match"));
+        }
+        if shape[1] != time_axis.len() {
+            return Err(PyValueError::new_err(
+                "Number of values does not match the time axis",
+            ));
+        }
+        let mut unique_names = HashSet::new();
+        if let Some(name) = names
+            .iter()
+            .find(|name| !unique_names.insert(name.as_str()) || self.0.get_by_name(name).is_some())
+        {
+            return Err(PyValueError::new_err(format!(
+                "timeseries {} already exists",
+                name
+            )));
+        }
+
+        let interpolation_strategy: InterpolationStrategy = interpolation_strategy.into();
+        let items = names
+            .into_iter()
+            .zip(units)
+            .zip(variable_types)
+            .zip(values.as_array().outer_iter())
+            .map(|(((name, units), variable_type), values)| TimeseriesItem {
+                timeseries: Timeseries::new(
+                    values.to_owned(),
+                    time_axis.clone(),
+                    units,
+                    interpolation_strategy.clone(),
+                ),
+                name,
+                variable_type,
+            });
+        self.0.add_many(items);
+        Ok(())
+    }
+
     pub fn get_timeseries_by_name(&self, name: &str) -> Option<PyTimeseries> {
         match self.0.get_timeseries_by_name(name) {
             // We must clone the result because we cannot return references to rust owned data
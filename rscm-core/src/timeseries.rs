@@ -1,12 +1,13 @@
-use crate::errors::RSCMResult;
+use crate::errors::{RSCMError, RSCMResult};
 use crate::interpolate::strategies::{InterpolationStrategy, LinearSplineStrategy};
 use crate::interpolate::Interp1d;
 use nalgebra::max;
 use num::{Float, ToPrimitive};
 use numpy::ndarray::prelude::*;
 use numpy::ndarray::{Array, Array1, ViewRepr};
-use serde::{Deserialize, Serialize};
+use serde::{Deserialize, Deserializer, Serialize};
 use std::iter::zip;
+use std::mem::MaybeUninit;
 use std::sync::Arc;
 
 /// The type of float used in time calculations
@@ -64,14 +65,16 @@ impl TimeAxis {
     /// ```
     pub fn from_values(values: Array1<Time>) -> Self {
         assert!(values.len() >= 2);
-        let step = values[values.len() - 1] - values[values.len() - 2];
+        let n = values.len();
+        let step = values[n - 1] - values[n - 2];
 
-        let mut bounds = Array::zeros(values.len() + 1);
-        bounds.slice_mut(s![..values.len()]).assign(&values);
+        // Avoid zeroing the bounds as every element is overwritten
+        let mut bounds = Array1::<Time>::uninit(n + 1);
+        values.assign_to(bounds.slice_mut(s![..n]));
+        bounds[n] = MaybeUninit::new(values[n - 1] + step);
 
-        let last_idx = bounds.len() - 1;
-
-        bounds[last_idx] = bounds[last_idx - 1] + step;
+        // SAFETY: All elements have been initialised above
+        let bounds = unsafe { bounds.assume_init() };
         Self::new(bounds)
     }
 
@@ -188,6 +191,47 @@ impl TimeAxis {
     }
 }
 
+/// Deserialise the values of a timeseries
+///
+/// Some formats (e.g. JSON) can't represent NaN values and serialise them as `null` instead.
+/// These `null` values are converted back into NaN so that the state of a model which hasn't
+/// been fully solved can be round-tripped.
+/// Otherwise, this mirrors the serialised representation of an ndarray.
+fn deserialize_values<'de, D, T>(deserializer: D) -> Result<Array1<T>, D::Error>
+where
+    D: Deserializer<'de>,
+    T: Float + Deserialize<'de>,
+{
+    #[derive(Deserialize)]
+    struct NullableArray<T> {
+        v: u8,
+        dim: Vec<usize>,
+        data: Vec<Option<T>>,
+    }
+
+    let array = NullableArray::<T>::deserialize(deserializer)?;
+
+    if array.v != 1 {
+        return Err(serde::de::Error::custom(format!(
+            "unknown array version: {}",
+            array.v
+        )));
+    }
+    if array.dim != [array.data.len()] {
+        return Err(serde::de::Error::custom(format!(
+            "data and dimension must match in size: {:?} != [{}]",
+            array.dim,
+            array.data.len()
+        )));
+    }
+
+    Ok(array
+        .data
+        .into_iter()
+        .map(|x| x.unwrap_or_else(T::nan))
+        .collect())
+}
+
 /// A contiguous set of values
 ///
 #[derive(Clone, Debug, Serialize, Deserialize)]
@@ -196,6 +240,10 @@ where
     T: Float,
 {
     units: String,
+    #[serde(
+        deserialize_with = "deserialize_values",
+        bound(deserialize = "T: Float + Deserialize<'de>")
+    )]
     values: Array1<T>,
     // Using a reference counted time axis to avoid having to maintain multiple clones of the
     // time axis.
@@ -289,13 +337,16 @@ where
         }
     }
 
+    /// Create a timeseries where every value is NaN
+    ///
+    /// Values are allocated for every step of the time axis
+    /// so they can be set in place without reallocating.
     pub fn new_empty(
         time_axis: Arc<TimeAxis>,
         units: String,
         interpolation_strategy: InterpolationStrategy,
     ) -> Self {
-        let mut arr = Array::zeros(time_axis.len());
-        arr.fill(T::nan());
+        let arr = Array::from_elem(time_axis.len(), T::nan());
 
         Self::new(arr, time_axis, units, interpolation_strategy)
     }
@@ -319,6 +370,38 @@ where
         interp.interpolate(time)
     }
 
+    /// Get the value at a time step of a time axis
+    ///
+    /// If the timeseries shares the same time axis (as is the case for the timeseries
+    /// within a model), the value is read directly without any interpolation.
+    /// Otherwise, the value is interpolated at the time of the step.
+    ///
+    /// # Examples
+    /// ```rust
+    /// use numpy::array;
+    /// use rscm_core::timeseries::{TimeAxis, Timeseries};
+    ///
+    /// let timeseries = Timeseries::from_values(array![1.0, 2.0, 3.0], array![2000.0, 2010.0, 2020.0]);
+    ///
+    /// assert_eq!(timeseries.at_time_index(&timeseries.time_axis(), 1).unwrap(), 2.0);
+    ///
+    /// let time_axis = TimeAxis::from_values(array![2005.0, 2015.0]);
+    /// assert_eq!(timeseries.at_time_index(&time_axis, 1).unwrap(), 2.5);
+    /// ```
+    pub fn at_time_index(&self, time_axis: &TimeAxis, index: usize) -> RSCMResult<T> {
+        if std::ptr::eq(self.time_axis.as_ref(), time_axis) && index < self.len() {
+            return Ok(self.values[index]);
+        }
+
+        match time_axis.at(index) {
+            Some(time) => self.at_time(time),
+            None => Err(RSCMError::Error(format!(
+                "Time index {} is outside of the time axis",
+                index
+            ))),
+        }
+    }
+
     /// Get the value of the timeseries at a given time index
     ///
     /// # Examples
@@ -365,12 +448,10 @@ where
     /// assert_eq!(new_timeseries.at(1).unwrap(), 1.5);
     /// ```
     pub fn interpolate_into(self, new_time_axis: Arc<TimeAxis>) -> Self {
-        let mut values = Array1::zeros(new_time_axis.len());
-        let interp = self.interpolator();
-
-        zip(new_time_axis.values().iter(), values.iter_mut()).for_each(|(t, value)| {
-            *value = interp.interpolate(*t).unwrap();
-        });
+        let values = self
+            .interpolator()
+            .interpolate_many(&new_time_axis.values())
+            .unwrap();
 
         Self::new(
             values,
@@ -399,6 +480,14 @@ mod tests {
     use crate::interpolate::strategies::{InterpolationStrategy, PreviousStrategy};
     use is_close::is_close;
 
+    #[test]
+    fn time_axis_from_values() {
+        let ta = TimeAxis::from_values(array![2000.0, 2020.0, 2040.0]);
+
+        assert_eq!(ta.bounds(), array![2000.0, 2020.0, 2040.0, 2060.0]);
+        assert_eq!(ta.values(), array![2000.0, 2020.0, 2040.0]);
+    }
+
     #[test]
     #[should_panic]
     fn check_monotonic_values() {
@@ -461,7 +550,6 @@ mod tests {
     }
 
     #[test]
-    #[should_panic]
     fn serialise_and_deserialise_with_nan_json() {
         let data = array![1.0, 1.5, FloatValue::nan()];
         let years = Array::range(2020.0, 2023.0, 1.0);
@@ -474,8 +562,12 @@ mod tests {
             r#"{"units":"","values":{"v":1,"dim":[3],"data":[1.0,1.5,null]},"time_axis":{"bounds":{"v":1,"dim":[4],"data":[2020.0,2021.0,2022.0,2023.0]}},"latest":2,"interpolation_strategy":"Linear"}"#
         );
 
-        // This panics as it can't handle null -> NaN values
-        serde_json::from_str::<Timeseries<f64>>(&serialised).unwrap();
+        // null values are deserialised as NaN
+        let deserialised = serde_json::from_str::<Timeseries<f64>>(&serialised).unwrap();
+
+        assert_eq!(deserialised.at(1).unwrap(), 1.5);
+        assert!(deserialised.at(2).unwrap().is_nan());
+        assert_eq!(deserialised.latest(), timeseries.latest());
     }
 
     #[test]
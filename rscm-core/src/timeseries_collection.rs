@@ -1,5 +1,5 @@
 use crate::timeseries::{FloatValue, Timeseries};
-use serde::{Deserialize, Serialize};
+use serde::{Deserialize, Deserializer, Serialize};
 
 #[derive(Copy, Clone, PartialOrd, PartialEq, Eq, Debug, Serialize, Deserialize)]
 #[pyo3::pyclass]
@@ -17,10 +17,25 @@ pub struct TimeseriesItem {
     pub variable_type: VariableType,
 }
 
+/// Deserialise the items of a collection ensuring that they are sorted by name
+fn deserialize_sorted<'de, D>(deserializer: D) -> Result<Vec<TimeseriesItem>, D::Error>
+where
+    D: Deserializer<'de>,
+{
+    let mut timeseries = Vec::<TimeseriesItem>::deserialize(deserializer)?;
+    timeseries.sort_unstable_by(|a, b| a.name.cmp(&b.name));
+    Ok(timeseries)
+}
+
 /// A collection of time series data.
 /// Allows for easy access to time series data by name across the whole model
+///
+/// The timeseries are kept sorted by name.
+/// This keeps the order of the serialised timeseries stable and
+/// allows a timeseries to be found using a binary search.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct TimeseriesCollection {
+    #[serde(deserialize_with = "deserialize_sorted")]
     timeseries: Vec<TimeseriesItem>,
 }
 
@@ -47,20 +62,53 @@ impl TimeseriesCollection {
         timeseries: Timeseries<FloatValue>,
         variable_type: VariableType,
     ) {
-        if self.timeseries.iter().any(|x| x.name == name) {
-            panic!("timeseries {} already exists", name)
+        match self.position(&name) {
+            Ok(_) => panic!("timeseries {} already exists", name),
+            Err(index) => self.timeseries.insert(
+                index,
+                TimeseriesItem {
+                    timeseries,
+                    name,
+                    variable_type,
+                },
+            ),
         }
-        self.timeseries.push(TimeseriesItem {
-            timeseries,
-            name,
-            variable_type,
-        });
-        // Ensure the order of the serialised timeseries is stable
-        self.timeseries.sort_unstable_by_key(|x| x.name.clone());
+    }
+
+    /// Add many timeseries to the collection at once
+    ///
+    /// The collection is sorted once after all the timeseries have been added,
+    /// rather than inserting each timeseries at its sorted position.
+    ///
+    /// Panics if any of the names are duplicated or already exist in the collection.
+    /// The collection is unchanged if this occurs.
+    pub fn add_many(&mut self, items: impl IntoIterator<Item = TimeseriesItem>) {
+        let mut items: Vec<TimeseriesItem> = items.into_iter().collect();
+        items.sort_unstable_by(|a, b| a.name.cmp(&b.name));
+
+        for (i, item) in items.iter().enumerate() {
+            if (i > 0 && items[i - 1].name == item.name) || self.position(&item.name).is_ok() {
+                panic!("timeseries {} already exists", item.name);
+            }
+        }
+
+        self.timeseries.extend(items);
+        self.timeseries.sort_by(|a, b| a.name.cmp(&b.name));
+    }
+
+    /// Find the index of a timeseries by name
+    ///
+    /// If the timeseries isn't present, the index where it should be inserted to keep the
+    /// collection sorted is returned as the error.
+    fn position(&self, name: &str) -> Result<usize, usize> {
+        self.timeseries
+            .binary_search_by(|x| x.name.as_str().cmp(name))
     }
 
     pub fn get_by_name(&self, name: &str) -> Option<&TimeseriesItem> {
-        self.timeseries.iter().find(|x| x.name == name)
+        self.position(name)
+            .ok()
+            .map(|index| &self.timeseries[index])
     }
 
     pub fn get_timeseries_by_name(&self, name: &str) -> Option<&Timeseries<FloatValue>> {
@@ -70,10 +118,9 @@ impl TimeseriesCollection {
         &mut self,
         name: &str,
     ) -> Option<&mut Timeseries<FloatValue>> {
-        self.timeseries
-            .iter_mut()
-            .find(|x| x.name == name)
-            .map(|item| &mut item.timeseries)
+        self.position(name)
+            .ok()
+            .map(|index| &mut self.timeseries[index].timeseries)
     }
 
     pub fn iter(&self) -> impl Iterator<Item = &TimeseriesItem> {
@@ -114,6 +161,83 @@ mod tests {
         );
     }
 
+    #[test]
+    fn get_by_name() {
+        let mut collection = TimeseriesCollection::new();
+
+        ["b", "c", "a"].iter().enumerate().for_each(|(i, name)| {
+            collection.add_timeseries(
+                name.to_string(),
+                Timeseries::from_values(
+                    array![i as FloatValue, 2.0, 3.0],
+                    Array::range(2020.0, 2023.0, 1.0),
+                ),
+                VariableType::Exogenous,
+            )
+        });
+
+        let names: Vec<&str> = collection.iter().map(|x| x.name.as_str()).collect();
+        assert_eq!(names, vec!["a", "b", "c"]);
+
+        assert_eq!(
+            collection.get_timeseries_by_name("a").unwrap().at(0),
+            Some(2.0)
+        );
+        assert_eq!(
+            collection.get_timeseries_by_name("b").unwrap().at(0),
+            Some(0.0)
+        );
+        assert_eq!(
+            collection.get_timeseries_by_name("c").unwrap().at(0),
+            Some(1.0)
+        );
+        assert!(collection.get_by_name("d").is_none());
+
+        collection
+            .get_timeseries_by_name_mut("c")
+            .unwrap()
+            .set(0, 4.0);
+        assert_eq!(
+            collection.get_timeseries_by_name("c").unwrap().at(0),
+            Some(4.0)
+        );
+    }
+
+    #[test]
+    fn add_many() {
+        let mut collection = TimeseriesCollection::new();
+        let timeseries =
+            Timeseries::from_values(array![1.0, 2.0, 3.0], Array::range(2020.0, 2023.0, 1.0));
+        collection.add_timeseries("b".to_string(), timeseries.clone(), VariableType::Exogenous);
+
+        collection.add_many(["d", "a", "c"].iter().map(|name| TimeseriesItem {
+            timeseries: timeseries.clone(),
+            name: name.to_string(),
+            variable_type: VariableType::Endogenous,
+        }));
+
+        let names: Vec<&str> = collection.iter().map(|x| x.name.as_str()).collect();
+        assert_eq!(names, vec!["a", "b", "c", "d"]);
+        assert_eq!(
+            collection.get_by_name("d").unwrap().variable_type,
+            VariableType::Endogenous
+        );
+    }
+
+    #[test]
+    #[should_panic]
+    fn add_many_same_name() {
+        let mut collection = TimeseriesCollection::new();
+        let timeseries =
+            Timeseries::from_values(array![1.0, 2.0, 3.0], Array::range(2020.0, 2023.0, 1.0));
+
+        collection.add_many(["a", "b", "a"].iter().map(|name| TimeseriesItem {
+            timeseries: timeseries.clone(),
+            name: name.to_string(),
+            variable_type: VariableType::Exogenous,
+        }));
+    }
+
     #[test]
     #[should_panic]
     fn adding_same_name() {
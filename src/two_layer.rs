@@ -114,7 +114,7 @@ impl Component for TwoLayerComponent {
 mod tests {
     use super::*;
     use numpy::array;
-    use rscm_core::timeseries::Timeseries;
+    use rscm_core::timeseries::{TimeAxis, Timeseries};
     use rscm_core::timeseries_collection::{TimeseriesCollection, VariableType};
 
     #[test]
@@ -139,7 +139,8 @@ mod tests {
             VariableType::Exogenous,
         );
 
-        let input_state = model.extract_state(&ts_collection, 1848.0);
+        let time_axis = TimeAxis::from_values(array![1848.0, 1849.0]);
+        let input_state = model.extract_state(&ts_collection, &time_axis, 0);
         println!("Input: {:?}", input_state);
 
         // Create the solver
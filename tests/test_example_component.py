@@ -1,7 +1,20 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import numpy.testing as npt
 import pytest
 
 from rscm._lib.core import TestComponentBuilder
-from rscm.core import PythonComponent, RequirementDefinition
+from rscm.core import (
+    InterpolationStrategy,
+    ModelBuilder,
+    PythonComponent,
+    RequirementDefinition,
+    RequirementType,
+    Timeseries,
+)
 
 
 class ExamplePythonComponent:
@@ -44,3 +57,152 @@ def test_user_derived_create_and_solve():
 
     res = component.solve(0, 1, {"input": 35.0})
     assert res["output"] == 35.0 * 3.0
+
+
+class BatchedPythonComponent:
+    def __init__(self):
+        self.calls = {"solve": 0, "solve_batch": 0}
+
+    def definitions(self) -> list[RequirementDefinition]:
+        return [
+            RequirementDefinition("input", "K", RequirementType.Input),
+            RequirementDefinition("output", "K", RequirementType.Output),
+        ]
+
+    def solve(
+        self, time_current: float, time_next: float, input_state: dict[str, float]
+    ) -> dict[str, float]:
+        self.calls["solve"] += 1
+        return {"output": input_state["input"] * 3}
+
+    def solve_batch(self, time_bounds: np.ndarray, input_states: np.ndarray):
+        self.calls["solve_batch"] += 1
+        assert len(time_bounds) == input_states.shape[0] + 1
+        return input_states * 3
+
+
+def test_user_derived_batched(time_axis):
+    py_component = BatchedPythonComponent()
+    input_ts = Timeseries(
+        np.arange(len(time_axis), dtype=float),
+        time_axis,
+        "K",
+        InterpolationStrategy.Previous,
+    )
+
+    model = (
+        ModelBuilder()
+        .with_py_component(PythonComponent.build(py_component))
+        .with_time_axis(time_axis)
+        .with_exogenous_variable("input", input_ts)
+    ).build()
+    model.run()
+
+    assert py_component.calls == {"solve": 0, "solve_batch": 1}
+
+    result = model.timeseries()
+    npt.assert_allclose(
+        result.get_timeseries_by_name("output").values()[1:],
+        result.get_timeseries_by_name("input").values()[:-1] * 3,
+    )
+
+
+class InvalidBatchedPythonComponent(BatchedPythonComponent):
+    def solve_batch(self, time_bounds: np.ndarray, input_states: np.ndarray):
+        return np.zeros((input_states.shape[0], 2))
+
+
+def test_user_derived_batched_invalid(time_axis):
+    input_ts = Timeseries(
+        np.arange(len(time_axis), dtype=float),
+        time_axis,
+        "K",
+        InterpolationStrategy.Previous,
+    )
+
+    model = (
+        ModelBuilder()
+        .with_py_component(PythonComponent.build(InvalidBatchedPythonComponent()))
+        .with_time_axis(time_axis)
+        .with_exogenous_variable("input", input_ts)
+    ).build()
+
+    # Rust panics are raised as pyo3_runtime.PanicException which derives from
+    # BaseException
+    with pytest.raises(BaseException, match="unexpected shape"):
+        model.run()
+
+
+class SolveIntoPythonComponent:
+    def __init__(self):
+        self.output_ids = set()
+
+    def definitions(self) -> list[RequirementDefinition]:
+        return [
+            RequirementDefinition("input", "K", RequirementType.Input),
+            RequirementDefinition("output", "K", RequirementType.Output),
+        ]
+
+    def solve(
+        self, time_current: float, time_next: float, input_state: dict[str, float]
+    ) -> dict[str, float]:
+        pytest.fail("solve_into should be used")
+
+    def solve_into(
+        self,
+        time_current: float,
+        time_next: float,
+        input_state: dict[str, float],
+        output_state: dict[str, float],
+    ):
+        assert output_state == {}
+        self.output_ids.add((threading.get_ident(), id(output_state)))
+        output_state["output"] = input_state["input"] * 3
+        # Give other threads the opportunity to run before the output is read
+        time.sleep(0)
+
+
+def test_user_derived_solve_into():
+    py_component = SolveIntoPythonComponent()
+    component = PythonComponent.build(py_component)
+
+    assert component.solve(0, 1, {"input": 35.0}) == {"output": 35.0 * 3.0}
+    assert component.solve(1, 2, {"input": 2.0}) == {"output": 2.0 * 3.0}
+
+    # The same output dictionary is reused
+    assert len(py_component.output_ids) == 1
+
+
+def test_user_derived_solve_into_threads(time_axis):
+    py_component = SolveIntoPythonComponent()
+    component = PythonComponent.build(py_component)
+
+    def run(offset):
+        input_ts = Timeseries(
+            np.arange(len(time_axis), dtype=float) + offset,
+            time_axis,
+            "K",
+            InterpolationStrategy.Previous,
+        )
+        model = (
+            ModelBuilder()
+            .with_py_component(component)
+            .with_time_axis(time_axis)
+            .with_exogenous_variable("input", input_ts)
+        ).build()
+        model.run()
+        return model.timeseries()
+
+    offsets = [0.0, 100.0, 200.0, 300.0]
+    with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+        results = list(executor.map(run, offsets))
+
+    # At most one output dictionary is created for each concurrent call
+    assert len({dict_id for _, dict_id in py_component.output_ids}) <= len(offsets)
+
+    # Each model gets its own results even though the component is shared
+    for offset, result in zip(offsets, results):
+        npt.assert_allclose(
+            result.get_timeseries_by_name("output").values()[1:],
+            (np.arange(len(time_axis), dtype=float)[:-1] + offset) * 3,
+        )
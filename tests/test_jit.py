@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from rscm.core import RequirementDefinition, RequirementType
+
+pytest.importorskip("numba")
+
+from rscm.jit import JitComponent, build_jit, source_hash  # noqa: E402
+
+DEFINITIONS = [
+    RequirementDefinition("input", "K", RequirementType.Input),
+    RequirementDefinition("output", "K", RequirementType.Output),
+]
+
+
+def scale(time_current, time_next, inputs):
+    return inputs * 3.0
+
+
+double = lambda time_current, time_next, inputs: inputs * 2.0  # noqa: E731
+triple = lambda time_current, time_next, inputs: inputs * 3.0  # noqa: E731
+
+
+def too_many(time_current, time_next, inputs):
+    return np.zeros(2)
+
+
+def test_jit_component_solve():
+    component = JitComponent(DEFINITIONS, scale)
+
+    assert component.input_names == ["input"]
+    assert component.output_names == ["output"]
+
+    res = component.solve(0.0, 1.0, {"input": 35.0})
+    assert res == {"output": 35.0 * 3.0}
+
+
+def test_jit_component_reuses_inputs():
+    component = JitComponent(DEFINITIONS, scale)
+    inputs = component._input_buffer()
+
+    assert component.solve(0.0, 1.0, {"input": 1.0}) == {"output": 3.0}
+    assert component.solve(1.0, 2.0, {"input": 2.0}) == {"output": 6.0}
+    assert component._input_buffer() is inputs
+
+
+def test_jit_component_threads():
+    # Compiled by whichever thread solves first
+    component = JitComponent(DEFINITIONS, scale)
+
+    def solve(value):
+        return [
+            component.solve(0.0, 1.0, {"input": value})["output"] for _ in range(1000)
+        ]
+
+    values = [float(i) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(solve, values))
+
+    for value, result in zip(values, results):
+        assert result == [value * 3.0] * 1000
+
+
+def test_jit_component_warmup():
+    component = JitComponent(DEFINITIONS, scale)
+    assert component.kernel.signatures == []
+
+    assert component.warmup() is component
+    assert len(component.kernel.signatures) == 1
+
+    assert component.solve(0.0, 1.0, {"input": 1.0}) == {"output": 3.0}
+    assert len(component.kernel.signatures) == 1
+
+
+def test_jit_component_cache(tmp_path, monkeypatch):
+    import numba
+
+    monkeypatch.setattr(numba.config, "CACHE_DIR", str(tmp_path))
+
+    JitComponent(DEFINITIONS, scale).warmup()
+    assert numba.config.CACHE_DIR == str(tmp_path)
+
+    hash_files = list(tmp_path.rglob("*.blake2b"))
+    assert len(hash_files) == 1
+    assert hash_files[0].read_text() == source_hash(scale)
+    assert list(tmp_path.rglob("*.nbi"))
+
+    # Stale hashes result in the cached kernel being recompiled
+    hash_files[0].write_text("stale")
+    component = JitComponent(DEFINITIONS, scale).warmup()
+    assert hash_files[0].read_text() == source_hash(scale)
+    assert component.solve(0.0, 1.0, {"input": 1.0}) == {"output": 3.0}
+
+
+def test_jit_component_cache_lambdas(tmp_path, monkeypatch):
+    import numba
+
+    monkeypatch.setattr(numba.config, "CACHE_DIR", str(tmp_path))
+
+    JitComponent(DEFINITIONS, double).warmup()
+    JitComponent(DEFINITIONS, triple).warmup()
+
+    hash_files = [p.name for p in tmp_path.rglob("*.blake2b")]
+    assert len(hash_files) == 2
+    assert not any("<" in name or ">" in name for name in hash_files)
+
+    # Compiling one lambda doesn't invalidate the cache of the other
+    component = JitComponent(DEFINITIONS, double).warmup()
+    assert sum(component.kernel.stats.cache_hits.values()) == 1
+    assert component.solve(0.0, 1.0, {"input": 1.0}) == {"output": 2.0}
+
+
+def test_jit_component_default_cache(tmp_path, monkeypatch):
+    import numba
+
+    monkeypatch.setattr(numba.config, "CACHE_DIR", "")
+    monkeypatch.chdir(tmp_path)
+
+    component = JitComponent(DEFINITIONS, scale).warmup()
+
+    assert component.kernel.stats.cache_path.startswith(str(tmp_path / ".rscm_cache"))
+    # numba's configuration isn't modified for other functions
+    assert numba.config.CACHE_DIR == ""
+
+
+def test_jit_component_default_cache_threads(tmp_path, monkeypatch):
+    import numba
+
+    monkeypatch.setattr(numba.config, "CACHE_DIR", "")
+    monkeypatch.chdir(tmp_path)
+
+    def create(_):
+        return JitComponent(DEFINITIONS, scale).kernel.stats.cache_path
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        cache_paths = list(executor.map(create, range(32)))
+
+    assert all(path.startswith(str(tmp_path / ".rscm_cache")) for path in cache_paths)
+    # Creating components concurrently doesn't leak the kernel cache directory
+    assert numba.config.CACHE_DIR == ""
+
+
+def test_jit_component_invalid_outputs():
+    component = JitComponent(DEFINITIONS, too_many)
+
+    with pytest.raises(ValueError, match="Unexpected number of outputs"):
+        component.solve(0.0, 1.0, {"input": 35.0})
+
+
+def test_build_jit():
+    component = build_jit(DEFINITIONS, scale)
+
+    res = component.solve(0, 1, {"input": 35.0})
+    assert res["output"] == 35.0 * 3.0
@@ -1,9 +1,18 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import numpy.testing as npt
+import pytest
 
 from rscm._lib import TwoLayerComponentBuilder
 from rscm._lib.core import InterpolationStrategy, Model, Timeseries
-from rscm.core import ModelBuilder
+from rscm.core import (
+    ModelBuilder,
+    PythonComponent,
+    RequirementDefinition,
+    RequirementType,
+)
 
 
 def test_model(time_axis):
@@ -80,3 +89,136 @@ def test_model_serialisation(time_axis):
         new_model.timeseries().get_timeseries_by_name("Surface Temperature").values(),
         model.timeseries().get_timeseries_by_name("Surface Temperature").values(),
     )
+
+
+def test_model_json_serialisation(time_axis):
+    component = TwoLayerComponentBuilder.from_parameters(
+        dict(
+            lambda0=0.0,
+            a=0.0,
+            efficacy=0.0,
+            eta=0.0,
+            heat_capacity_deep=0.0,
+            heat_capacity_surface=0.0,
+        )
+    ).build()
+
+    builder = ModelBuilder()
+    builder.with_time_axis(time_axis).with_rust_component(component)
+    erf = Timeseries(
+        np.asarray([1.0] * len(time_axis)),
+        time_axis,
+        "W / m^2",
+        InterpolationStrategy.Next,
+    )
+
+    model = builder.with_exogenous_variable("Effective Radiative Forcing", erf).build()
+
+    model.step()
+
+    serialised_model = model.to_json()
+    assert isinstance(serialised_model, bytes)
+
+    # Unsolved values are NaN which must survive the round trip
+    new_model = Model.from_json(serialised_model)
+
+    assert new_model.as_dot() == model.as_dot()
+    assert new_model.current_time() == model.current_time()
+    npt.assert_allclose(
+        new_model.timeseries().get_timeseries_by_name("Surface Temperature").values(),
+        model.timeseries().get_timeseries_by_name("Surface Temperature").values(),
+    )
+
+    assert Model.from_json(serialised_model.decode()).to_toml() == model.to_toml()
+    assert Model.from_dict(model.to_dict()).to_toml() == model.to_toml()
+
+    with pytest.raises(ValueError):
+        Model.from_json(b"{")
+
+
+def test_model_run_threads(time_axis):
+    def run(lambda0):
+        component = TwoLayerComponentBuilder.from_parameters(
+            dict(
+                lambda0=lambda0,
+                a=0.0,
+                efficacy=0.0,
+                eta=0.0,
+                heat_capacity_deep=0.0,
+                heat_capacity_surface=0.0,
+            )
+        ).build()
+        erf = Timeseries(
+            np.asarray([1.0] * len(time_axis)),
+            time_axis,
+            "W / m^2",
+            InterpolationStrategy.Next,
+        )
+        model = (
+            ModelBuilder()
+            .with_time_axis(time_axis)
+            .with_rust_component(component)
+            .with_exogenous_variable("Effective Radiative Forcing", erf)
+            .build()
+        )
+        model.run()
+        return model.timeseries().get_timeseries_by_name("Surface Temperature")
+
+    parameters = [0.0, 0.5, 1.0, 1.5]
+    with ThreadPoolExecutor(max_workers=len(parameters)) as executor:
+        results = list(executor.map(run, parameters))
+
+    for lambda0, result in zip(parameters, results):
+        npt.assert_allclose(result.values(), run(lambda0).values())
+
+
+class BarrierComponent:
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+
+    def definitions(self) -> list[RequirementDefinition]:
+        return [
+            RequirementDefinition("input", "K", RequirementType.Input),
+            RequirementDefinition("output", "K", RequirementType.Output),
+        ]
+
+    def solve(
+        self, time_current: float, time_next: float, input_state: dict[str, float]
+    ) -> dict[str, float]:
+        # Blocks until the other model reaches the same step
+        self.barrier.wait()
+        return {"output": input_state["input"]}
+
+
+def test_model_step_run_concurrently(time_axis):
+    # Both models must be solving at the same time to pass the barrier.
+    # The timeout turns a deadlock into a BrokenBarrierError instead of hanging
+    barrier = threading.Barrier(2, timeout=10)
+
+    def run(offset):
+        input_ts = Timeseries(
+            np.arange(len(time_axis), dtype=float) + offset,
+            time_axis,
+            "K",
+            InterpolationStrategy.Previous,
+        )
+        model = (
+            ModelBuilder()
+            .with_py_component(PythonComponent.build(BarrierComponent(barrier)))
+            .with_time_axis(time_axis)
+            .with_exogenous_variable("input", input_ts)
+            .build()
+        )
+        model.step()
+        model.run()
+        return model.timeseries().get_timeseries_by_name("output")
+
+    offsets = [0.0, 100.0]
+    with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+        results = list(executor.map(run, offsets))
+
+    for offset, result in zip(offsets, results):
+        npt.assert_allclose(
+            result.values()[1:],
+            np.arange(len(time_axis), dtype=float)[:-1] + offset,
+        )
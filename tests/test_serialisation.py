@@ -0,0 +1,85 @@
+import io
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from rscm._lib import TwoLayerComponentBuilder
+from rscm._lib.core import InterpolationStrategy, Model, Timeseries
+from rscm.core import ModelBuilder
+from rscm.serialisation import TruncatedStateError, read_states, write_state
+
+
+@pytest.fixture()
+def model(time_axis):
+    component = TwoLayerComponentBuilder.from_parameters(
+        dict(
+            lambda0=0.0,
+            a=0.0,
+            efficacy=0.0,
+            eta=0.0,
+            heat_capacity_deep=0.0,
+            heat_capacity_surface=0.0,
+        )
+    ).build()
+    erf = Timeseries(
+        np.asarray([1.0] * len(time_axis)),
+        time_axis,
+        "W / m^2",
+        InterpolationStrategy.Next,
+    )
+
+    return (
+        ModelBuilder()
+        .with_time_axis(time_axis)
+        .with_rust_component(component)
+        .with_exogenous_variable("Effective Radiative Forcing", erf)
+        .build()
+    )
+
+
+def test_msgpack_round_trip(model):
+    model.step()
+
+    new_model = Model.from_msgpack(model.to_msgpack())
+
+    assert new_model.as_dot() == model.as_dot()
+    assert new_model.current_time() == model.current_time()
+    assert new_model.to_toml() == model.to_toml()
+
+
+def test_msgpack_invalid():
+    with pytest.raises(ValueError):
+        Model.from_msgpack(b"not a model")
+
+
+def test_write_and_read_states(model):
+    stream = io.BytesIO()
+
+    times = []
+    for _ in range(3):
+        model.step()
+        times.append(model.current_time())
+        write_state(stream, model)
+
+    stream.seek(0)
+    states = list(read_states(stream))
+
+    assert [state.current_time() for state in states] == times
+    npt.assert_allclose(
+        states[-1].timeseries().get_timeseries_by_name("Surface Temperature").values(),
+        model.timeseries().get_timeseries_by_name("Surface Temperature").values(),
+    )
+
+
+def test_read_states_truncated(model):
+    stream = io.BytesIO()
+    write_state(stream, model)
+
+    truncated = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(TruncatedStateError, match="Truncated state payload"):
+        list(read_states(truncated))
+
+    truncated = io.BytesIO(stream.getvalue()[:2])
+    with pytest.raises(TruncatedStateError, match="Truncated state header"):
+        list(read_states(truncated))
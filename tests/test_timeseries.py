@@ -26,6 +26,16 @@ class TestTimeAxis:
         assert values[0] == 1200.0
         assert time_axis.values()[0] == 1850.0
 
+    def test_time_axis_values_view(self, time_axis):
+        values = time_axis.values_view()
+
+        assert not values.flags["OWNDATA"]
+        assert not values.flags["WRITEABLE"]
+        npt.assert_allclose(values, time_axis.values())
+
+        with pytest.raises(ValueError, match="read-only"):
+            values[0] = 1200
+
     def test_time_axis_create_from_list(self):
         match = "'list' object cannot be converted to 'PyArray<T, D>'"
         with pytest.raises(TypeError, match=match):
@@ -61,6 +71,19 @@ class TestTimeseries:
         ts.set(0, 42.0)
         assert ts.values()[0] == 42.0
 
+    def test_values_view(self, timeseries):
+        values = timeseries.values_view()
+
+        assert not values.flags["OWNDATA"]
+        assert not values.flags["WRITEABLE"]
+        npt.assert_allclose(values, timeseries.values())
+
+        with pytest.raises(ValueError, match="read-only"):
+            values[0] = 42.0
+
+        timeseries.set(0, 42.0)
+        assert values[0] == 42.0
+
     def test_create_invalid(self, time_axis):
         values = np.arange(0.0, 10.0)
         assert len(values) != len(time_axis)
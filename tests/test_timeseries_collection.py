@@ -1,4 +1,11 @@
-from rscm.core import TimeseriesCollection, VariableType
+import numpy as np
+import pytest
+
+from rscm.core import (
+    InterpolationStrategy,
+    TimeseriesCollection,
+    VariableType,
+)
 
 
 class TestTimeseriesCollection:
@@ -33,3 +40,70 @@ class TestTimeseriesCollection:
         ts_from_collection.set(0, 3.0)
 
         assert collection.get_timeseries_by_name("Test").at(0) == 1850.0
+
+    def test_add_many(self, time_axis, timeseries):
+        collection = TimeseriesCollection()
+        collection.add_timeseries("b", timeseries, VariableType.Exogenous)
+
+        values = np.arange(2 * len(time_axis), dtype=float).reshape(2, -1)
+        collection.add_many(
+            ["c", "a"],
+            values,
+            time_axis,
+            ["K", "W / m^2"],
+            [VariableType.Exogenous, VariableType.Endogenous],
+            InterpolationStrategy.Linear,
+        )
+
+        assert collection.names() == ["a", "b", "c"]
+        np.testing.assert_allclose(
+            collection.get_timeseries_by_name("c").values(), values[0]
+        )
+        assert collection.get_timeseries_by_name("a").units == "W / m^2"
+
+    def test_add_many_invalid(self, time_axis):
+        collection = TimeseriesCollection()
+
+        with pytest.raises(ValueError, match="Lengths do not match"):
+            collection.add_many(
+                ["a"],
+                np.zeros((2, len(time_axis))),
+                time_axis,
+                ["K"],
+                [VariableType.Exogenous],
+                InterpolationStrategy.Linear,
+            )
+        with pytest.raises(ValueError, match="does not match the time axis"):
+            collection.add_many(
+                ["a"],
+                np.zeros((1, len(time_axis) + 1)),
+                time_axis,
+                ["K"],
+                [VariableType.Exogenous],
+                InterpolationStrategy.Linear,
+            )
+        assert collection.names() == []
+
+    def test_add_many_duplicate(self, time_axis, timeseries):
+        collection = TimeseriesCollection()
+        collection.add_timeseries("a", timeseries, VariableType.Exogenous)
+
+        with pytest.raises(ValueError, match="timeseries b already exists"):
+            collection.add_many(
+                ["b", "b"],
+                np.zeros((2, len(time_axis))),
+                time_axis,
+                ["K", "K"],
+                [VariableType.Exogenous, VariableType.Exogenous],
+                InterpolationStrategy.Linear,
+            )
+        with pytest.raises(ValueError, match="timeseries a already exists"):
+            collection.add_many(
+                ["c", "a"],
+                np.zeros((2, len(time_axis))),
+                time_axis,
+                ["K", "K"],
+                [VariableType.Exogenous, VariableType.Exogenous],
+                InterpolationStrategy.Linear,
+            )
+        assert collection.names() == ["a"]